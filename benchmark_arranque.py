@@ -0,0 +1,99 @@
+# benchmark_arranque.py
+# Mide el arranque en frío de la aplicación tal como lo vive un worker nuevo
+# de gunicorn: cuánto tarda importar app.py y cuánto tarda la primera
+# respuesta (que abre el pool y comprueba la versión del esquema). Cada
+# arranque se mide en un proceso de Python nuevo.
+#
+# Uso:
+#   python benchmark_arranque.py                    # 5 arranques contra /
+#   python benchmark_arranque.py --veces 10 --ruta /servicios
+#   python benchmark_arranque.py --modulos          # además, los imports más lentos
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+
+# Código que corre en cada proceso nuevo; imprime los tiempos como JSON
+MEDICION = '''
+import json, sys, time
+inicio = time.perf_counter()
+import app
+importado = time.perf_counter()
+cliente = app.app.test_client()
+respuesta = cliente.get(sys.argv[1])
+primera = time.perf_counter()
+cliente.get(sys.argv[1])
+segunda = time.perf_counter()
+print(json.dumps({
+    "estado": respuesta.status_code,
+    "importar": importado - inicio,
+    "primera": primera - importado,
+    "total": primera - inicio,
+    "segunda": segunda - primera,
+}))
+'''
+
+METRICAS = [
+    ('importar', 'importar app.py'),
+    ('primera', 'primera respuesta'),
+    ('total', 'arranque hasta la 1ª respuesta'),
+    ('segunda', 'segunda respuesta'),
+]
+
+def medir_arranque(ruta):
+    """Arrancar la aplicación en un proceso nuevo y devolver sus tiempos"""
+    salida = subprocess.run(
+        [sys.executable, '-c', MEDICION, ruta],
+        cwd=DIRECTORIO, capture_output=True, text=True, check=True
+    )
+    # app.py imprime mensajes propios; el JSON es la última línea
+    return json.loads(salida.stdout.strip().splitlines()[-1])
+
+def modulos_lentos(limite=12):
+    """Imports directos de app.py ordenados por tiempo acumulado (-X importtime)"""
+    salida = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import app'],
+        cwd=DIRECTORIO, capture_output=True, text=True, check=True
+    )
+    modulos = []
+    for linea in salida.stderr.splitlines():
+        if not linea.startswith('import time:') or 'cumulative' in linea:
+            continue
+        propio, acumulado, nombre = linea[len('import time:'):].split('|')
+        nivel = (len(nombre) - len(nombre.lstrip(' ')) - 1) // 2
+        if nivel <= 1:
+            modulos.append((int(acumulado) / 1000, int(propio) / 1000, nombre.strip()))
+    return sorted(modulos, reverse=True)[:limite]
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark de arranque de app.py')
+    parser.add_argument('--veces', type=int, default=5, help='arranques a medir')
+    parser.add_argument('--ruta', default='/', help='ruta de la primera petición')
+    parser.add_argument('--modulos', action='store_true', help='mostrar los imports más lentos')
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print(f"🚀 BENCHMARK DE ARRANQUE ({args.veces} arranques, GET {args.ruta})")
+    print("=" * 70)
+
+    medidas = [medir_arranque(args.ruta) for _ in range(args.veces)]
+    estados = sorted({m['estado'] for m in medidas})
+    print(f"   códigos de respuesta: {', '.join(map(str, estados))}")
+    print(f"   {'':32} {'mediana':>9} {'mín':>9} {'máx':>9}")
+    for clave, nombre in METRICAS:
+        valores = [m[clave] * 1000 for m in medidas]
+        print(f"   {nombre:32} {statistics.median(valores):7.1f}ms {min(valores):7.1f}ms {max(valores):7.1f}ms")
+
+    if args.modulos:
+        print("\n📦 Imports más lentos (acumulado / propio)")
+        for acumulado, propio, nombre in modulos_lentos():
+            print(f"   {acumulado:7.1f}ms {propio:7.1f}ms  {nombre}")
+
+    print("=" * 70)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# benchmark_contrasenas.py
+# Mide cuántos logins por segundo soporta cada algoritmo/coste de hash de
+# contraseñas, para elegir PASSWORD_ALGORITMO y PASSWORD_COSTE:
+#   - por núcleo: verificaciones seguidas en un solo hilo
+#   - en paralelo: muchas peticiones a la vez pasando por el pool acotado de
+#     app.py (PASSWORD_HILOS hilos), como en una ráfaga de logins
+#
+# Uso:
+#   python benchmark_contrasenas.py
+#   python benchmark_contrasenas.py --hilos 4 --peticiones 64
+#   python benchmark_contrasenas.py --algoritmos bcrypt:10 bcrypt:12 scrypt:32768:8:1
+import argparse
+import os
+import statistics
+import threading
+import time
+
+from app import app, hashear_contrasena, verificar_contrasena
+
+ALGORITMOS = ['bcrypt:10', 'bcrypt:11', 'bcrypt:12', 'bcrypt:13',
+              'scrypt:32768:8:1', 'pbkdf2:sha256:600000']
+
+def configurar(algoritmo):
+    """Aplicar 'bcrypt:<coste>' o un método de werkzeug a la configuración"""
+    if algoritmo.startswith('bcrypt'):
+        app.config['PASSWORD_ALGORITMO'] = 'bcrypt'
+        app.config['PASSWORD_COSTE'] = int(algoritmo.split(':')[1]) if ':' in algoritmo else 12
+    else:
+        app.config['PASSWORD_ALGORITMO'] = algoritmo
+
+def por_nucleo(password_hash, repeticiones):
+    """Mediana de segundos por verificación en un solo hilo"""
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        verificar_contrasena(password_hash, 'contraseña-de-prueba')
+        tiempos.append(time.perf_counter() - inicio)
+    return statistics.median(tiempos)
+
+def en_paralelo(password_hash, peticiones):
+    """Verificaciones por segundo con `peticiones` hilos lanzados a la vez"""
+    barrera = threading.Barrier(peticiones + 1)
+
+    def login():
+        barrera.wait()
+        verificar_contrasena(password_hash, 'contraseña-de-prueba')
+
+    hilos = [threading.Thread(target=login) for _ in range(peticiones)]
+    for hilo in hilos:
+        hilo.start()
+    barrera.wait()
+    inicio = time.perf_counter()
+    for hilo in hilos:
+        hilo.join()
+    return peticiones / (time.perf_counter() - inicio)
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark de hash de contraseñas')
+    parser.add_argument('--algoritmos', nargs='+', default=ALGORITMOS)
+    parser.add_argument('--hilos', type=int, default=os.cpu_count() or 1, help='PASSWORD_HILOS')
+    parser.add_argument('--peticiones', type=int, default=32, help='logins simultáneos')
+    parser.add_argument('--repeticiones', type=int, default=5)
+    args = parser.parse_args()
+
+    # Sin límite de espera: aquí interesa el rendimiento, no el rechazo
+    app.config['PASSWORD_HILOS'] = args.hilos
+    app.config['PASSWORD_COLA'] = args.peticiones
+    app.config['PASSWORD_ESPERA'] = 600
+
+    print("=" * 70)
+    print(f"🔐 BENCHMARK DE CONTRASEÑAS ({args.hilos} hilos de hash, "
+          f"{args.peticiones} logins simultáneos, {os.cpu_count()} CPUs)")
+    print("=" * 70)
+    print(f"   {'algoritmo':24} {'ms/login':>9} {'logins/s/núcleo':>16} {'logins/s total':>15}")
+
+    for algoritmo in args.algoritmos:
+        configurar(algoritmo)
+        password_hash = hashear_contrasena('contraseña-de-prueba')
+        segundos = por_nucleo(password_hash, args.repeticiones)
+        total = en_paralelo(password_hash, args.peticiones)
+        print(f"   {algoritmo:24} {segundos * 1000:9.1f} {1 / segundos:16.1f} {total:15.1f}")
+
+    print("=" * 70)
+
+if __name__ == "__main__":
+    main()
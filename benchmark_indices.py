@@ -0,0 +1,143 @@
+# benchmark_indices.py
+# Compara los planes de ejecución de las consultas principales de app.py
+# con y sin los índices definidos en INDICES.
+#
+# Uso:
+#   python benchmark_indices.py              # resumen de tiempos y nodos
+#   python benchmark_indices.py --planes     # además, los planes completos
+#
+# Los índices se eliminan dentro de una transacción que se deshace al final,
+# así que la base de datos queda igual; mientras tanto las tablas quedan
+# bloqueadas, por lo que no debe ejecutarse en horas de tráfico.
+import sys
+import psycopg2
+
+from app import COLUMNAS_DENUNCIAS, COLUMNAS_REPORTES, COLUMNAS_USUARIOS, DATABASE_URL, INDICES, columnas_de
+
+CONSULTAS = [
+    ('mis_reportes (página 1)',
+     f'''SELECT {COLUMNAS_REPORTES} FROM reportes WHERE usuario_id = %(usuario)s
+        ORDER BY fecha_reporte DESC, id DESC LIMIT 26'''),
+    ('admin_reportes estado=pendiente',
+     f'''SELECT {columnas_de(COLUMNAS_REPORTES, 'r')}, u.nombre AS usuario_nombre FROM reportes r
+        JOIN usuarios u ON r.usuario_id = u.id
+        WHERE 1=1 AND r.estado = 'pendiente'
+        ORDER BY r.fecha_reporte DESC, r.id DESC LIMIT 26'''),
+    ('admin_reportes página profunda',
+     f'''SELECT {columnas_de(COLUMNAS_REPORTES, 'r')}, u.nombre AS usuario_nombre FROM reportes r
+        JOIN usuarios u ON r.usuario_id = u.id
+        WHERE 1=1 AND (r.fecha_reporte, r.id) < (%(fecha_media)s, %(id_medio)s)
+        ORDER BY r.fecha_reporte DESC, r.id DESC LIMIT 26'''),
+    ('admin_reportes categoria',
+     f'''SELECT {columnas_de(COLUMNAS_REPORTES, 'r')}, u.nombre AS usuario_nombre FROM reportes r
+        JOIN usuarios u ON r.usuario_id = u.id
+        WHERE 1=1 AND r.categoria = %(categoria)s
+        ORDER BY r.fecha_reporte DESC, r.id DESC LIMIT 26'''),
+    ('comentarios de un reporte',
+     '''SELECT c.*, u.nombre AS usuario_nombre FROM comentarios c
+        JOIN usuarios u ON c.usuario_id = u.id
+        WHERE c.reporte_id = %(id_medio)s ORDER BY c.fecha ASC'''),
+    ('Last-Modified de la portada',
+     '''SELECT GREATEST(
+            (SELECT MAX(fecha_publicacion) FROM avisos),
+            (SELECT MAX(fecha_actualizacion) FROM reportes),
+            (SELECT MAX(fecha_actualizacion) FROM denuncias),
+            (SELECT MAX(fecha_actualizacion) FROM servicios),
+            (SELECT MAX(fecha_actualizacion) FROM proyectos))'''),
+    ('admin_usuarios (página 1)',
+     f'''SELECT {COLUMNAS_USUARIOS} FROM usuarios WHERE 1=1
+        ORDER BY creado_en DESC, id DESC LIMIT 26'''),
+    ('admin_usuarios búsqueda',
+     f'''SELECT {COLUMNAS_USUARIOS}, ts_rank(busqueda, q) AS relevancia
+        FROM usuarios, to_tsquery('simple', 'mar:* & gom:*') q WHERE busqueda @@ q
+        ORDER BY relevancia DESC, creado_en DESC, id DESC LIMIT 25'''),
+    ('búsqueda de texto en reportes',
+     '''SELECT id, ts_rank(busqueda, q) AS relevancia
+        FROM reportes, websearch_to_tsquery('spanish', 'reporte 50704') q
+        WHERE busqueda @@ q ORDER BY relevancia DESC, id DESC LIMIT 26'''),
+    ('mis_denuncias (página 1)',
+     f'''SELECT {COLUMNAS_DENUNCIAS} FROM denuncias WHERE usuario_id = %(usuario)s
+        ORDER BY fecha_denuncia DESC, id DESC LIMIT 26'''),
+]
+
+def parametros_de_prueba(cur):
+    """Tomar valores reales de la BD para que los planes sean representativos"""
+    cur.execute('SELECT usuario_id FROM reportes GROUP BY usuario_id ORDER BY COUNT(*) DESC LIMIT 1')
+    fila = cur.fetchone()
+    usuario = fila[0] if fila else 1
+
+    cur.execute('SELECT categoria FROM reportes GROUP BY categoria ORDER BY COUNT(*) LIMIT 1')
+    fila = cur.fetchone()
+    categoria = fila[0] if fila else ''
+
+    cur.execute('''SELECT fecha_reporte, id FROM reportes
+                   ORDER BY fecha_reporte DESC, id DESC
+                   OFFSET (SELECT COUNT(*) / 2 FROM reportes) LIMIT 1''')
+    fila = cur.fetchone() or (None, 0)
+
+    return {'usuario': usuario, 'categoria': categoria,
+            'fecha_media': fila[0], 'id_medio': fila[1]}
+
+def medir(cur, query, params):
+    """Ejecutar EXPLAIN ANALYZE y devolver (milisegundos, nodos principales, plan en texto)"""
+    cur.execute('EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) ' + query, params)
+    plan = cur.fetchone()[0][0]
+
+    nodos = []
+    def recorrer(nodo):
+        if 'Scan' in nodo['Node Type']:
+            nodos.append(f"{nodo['Node Type']}" + (f" ({nodo['Index Name']})" if 'Index Name' in nodo else ''))
+        for hijo in nodo.get('Plans', []):
+            recorrer(hijo)
+    recorrer(plan['Plan'])
+
+    cur.execute('EXPLAIN ANALYZE ' + query, params)
+    texto = '\n'.join(fila[0] for fila in cur.fetchall())
+    return plan['Execution Time'], nodos, texto
+
+def main():
+    mostrar_planes = '--planes' in sys.argv
+
+    conn = psycopg2.connect(DATABASE_URL)
+    cur = conn.cursor()
+    params = parametros_de_prueba(cur)
+
+    cur.execute('SELECT COUNT(*) FROM reportes')
+    print("=" * 70)
+    print(f"📊 BENCHMARK DE ÍNDICES ({cur.fetchone()[0]} reportes)")
+    print("=" * 70)
+
+    # Después: con los índices actuales
+    despues = {}
+    for nombre, query in CONSULTAS:
+        despues[nombre] = medir(cur, query, params)
+    conn.rollback()
+
+    # Antes: los mismos planes sin los índices (se deshace al final)
+    for indice, *_ in INDICES:
+        cur.execute(f'DROP INDEX IF EXISTS {indice}')
+    antes = {}
+    for nombre, query in CONSULTAS:
+        antes[nombre] = medir(cur, query, params)
+    conn.rollback()
+
+    for nombre, _ in CONSULTAS:
+        ms_antes, nodos_antes, plan_antes = antes[nombre]
+        ms_despues, nodos_despues, plan_despues = despues[nombre]
+        mejora = ms_antes / ms_despues if ms_despues else float('inf')
+        print(f"\n🔎 {nombre}")
+        print(f"   sin índices: {ms_antes:9.3f} ms  {', '.join(nodos_antes)}")
+        print(f"   con índices: {ms_despues:9.3f} ms  {', '.join(nodos_despues)}")
+        print(f"   mejora: x{mejora:.1f}")
+        if mostrar_planes:
+            print("   --- plan sin índices ---")
+            print('   ' + plan_antes.replace('\n', '\n   '))
+            print("   --- plan con índices ---")
+            print('   ' + plan_despues.replace('\n', '\n   '))
+
+    cur.close()
+    conn.close()
+    print("\n" + "=" * 70)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+# construir_estaticos.py
+# Prepara static/ para producción. Se ejecuta en el build, antes de arrancar
+# gunicorn (en Render: después de `pip install -r requirements.txt`):
+#   - minifica CSS y JS
+#   - copia cada archivo a static/dist/ con el hash de su contenido en el nombre
+#   - genera al lado versiones precomprimidas .br y .gz
+#   - reduce las imágenes grandes y crea su versión WebP
+#   - escribe static/dist/manifiesto.json, con el que app.py resuelve
+#     url_for('static', ...) y elige qué variante servir (ver ARCHIVOS ESTÁTICOS)
+#
+# Las copias de builds anteriores se conservan (su nombre no choca con las
+# nuevas) para las páginas que aún las tengan en caché; --limpiar las borra.
+#
+# Uso:
+#   python construir_estaticos.py
+#   python construir_estaticos.py --lado 256     # lado máximo de las imágenes
+#   python construir_estaticos.py --limpiar
+import argparse
+import gzip
+import hashlib
+import io
+import json
+import os
+import re
+import shutil
+
+import brotli
+from PIL import Image
+
+from app import app
+
+DESTINO = 'dist'
+OMITIR = {DESTINO, 'uploads'}  # carpetas de static/ que no son del build
+
+COMPRIMIBLES = {'.css', '.js', '.svg', '.json', '.txt', '.ico'}
+IMAGENES = {'.png', '.jpg', '.jpeg'}
+
+# Las imágenes de la interfaz se muestran a 45-50 px: 256 cubre pantallas 4x
+LADO_IMAGEN = 256
+
+CADENA = re.compile(r'''("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')''')
+
+def minificar_css(texto):
+    """Quitar comentarios y espacios sobrantes, sin tocar las cadenas"""
+    partes = CADENA.split(re.sub(r'/\*.*?\*/', '', texto, flags=re.S))
+    for i in range(0, len(partes), 2):
+        trozo = re.sub(r'\s+', ' ', partes[i])
+        trozo = re.sub(r'\s*([{};,>])\s*', r'\1', trozo)
+        trozo = re.sub(r':\s+', ':', trozo)
+        partes[i] = trozo.replace(';}', '}')
+    return ''.join(partes).strip()
+
+def quitar_comentario_inicial(linea, en_comentario):
+    """Quitar el comentario /* */ que abre la línea o que viene de las anteriores.
+
+    Devuelve (lo que queda de la línea, si el comentario sigue abierto); el
+    código que sigue a */ se conserva.
+    """
+    while True:
+        if en_comentario:
+            fin = linea.find('*/')
+            if fin < 0:
+                return '', True
+            linea, en_comentario = linea[fin + 2:], False
+        elif linea.lstrip().startswith('/*'):
+            linea, en_comentario = linea.lstrip()[2:], True
+        else:
+            return linea, False
+
+def minificar_js(texto):
+    """Quitar sangría, líneas vacías, comentarios de línea completa y los /* */ iniciales.
+
+    Conservador a propósito: no une líneas (la inserción automática de ';'
+    sigue igual) y deja intactas las plantillas `...` de varias líneas.
+    """
+    lineas = []
+    en_plantilla = en_comentario = False
+    for linea in texto.splitlines():
+        if not en_plantilla:
+            linea, en_comentario = quitar_comentario_inicial(linea, en_comentario)
+        limpia = linea.strip()
+        # Un número impar de ` abre o cierra una plantilla de varias líneas
+        cambia = len(re.findall(r'(?<!\\)`', linea)) % 2
+        if en_plantilla:
+            lineas.append(linea)
+        elif limpia and not limpia.startswith('//'):
+            # Si la línea abre una plantilla, lo que sigue a ` es su contenido
+            lineas.append(linea.lstrip() if cambia else limpia)
+        if cambia:
+            en_plantilla = not en_plantilla
+    return '\n'.join(lineas) + '\n'
+
+def reducir_imagen(ruta, lado):
+    """Devolver (bytes en el formato original, bytes WebP) con lado máximo `lado`, sin metadatos"""
+    with Image.open(ruta) as imagen:
+        imagen.load()
+        formato = imagen.format
+        icc = imagen.info.get('icc_profile')
+        imagen.thumbnail((lado, lado), Image.LANCZOS)
+        imagen.info = {}
+
+        original = io.BytesIO()
+        if formato == 'JPEG':
+            imagen.save(original, 'JPEG', quality=85, optimize=True, progressive=True, icc_profile=icc)
+        else:
+            imagen.save(original, formato, optimize=True, icc_profile=icc)
+        webp = io.BytesIO()
+        imagen.save(webp, 'WEBP', quality=85, method=6, icc_profile=icc)
+    return original.getvalue(), webp.getvalue()
+
+def escribir(relativa, datos):
+    """Guardar datos en static/<relativa> (vía temporal)"""
+    ruta = os.path.join(app.static_folder, relativa)
+    os.makedirs(os.path.dirname(ruta), exist_ok=True)
+    with open(ruta + '.tmp', 'wb') as salida:
+        salida.write(datos)
+    os.replace(ruta + '.tmp', ruta)
+
+def con_hash(relativa, datos):
+    """dist/<carpeta>/<nombre>.<hash>.<ext> para un archivo de static/"""
+    base, extension = os.path.splitext(relativa)
+    return f"{DESTINO}/{base}.{hashlib.sha256(datos).hexdigest()[:10]}{extension}"
+
+def procesar(relativa, lado, manifiesto):
+    """Añadir al build un archivo de static/ y anotarlo en el manifiesto"""
+    ruta = os.path.join(app.static_folder, relativa)
+    extension = os.path.splitext(relativa)[1].lower()
+    alternativas = {}
+
+    if extension in IMAGENES:
+        datos, webp = reducir_imagen(ruta, lado)
+        if len(datos) >= os.path.getsize(ruta):
+            with open(ruta, 'rb') as entrada:
+                datos = entrada.read()
+        final = con_hash(relativa, datos)
+        if len(webp) < len(datos):
+            alternativas['webp'] = os.path.splitext(final)[0] + '.webp'
+            escribir(alternativas['webp'], webp)
+    else:
+        with open(ruta, 'rb') as entrada:
+            datos = entrada.read()
+        if extension == '.css':
+            datos = minificar_css(datos.decode('utf-8')).encode('utf-8')
+        elif extension == '.js':
+            datos = minificar_js(datos.decode('utf-8')).encode('utf-8')
+        final = con_hash(relativa, datos)
+
+    escribir(final, datos)
+    if extension in COMPRIMIBLES:
+        for clave, sufijo, comprimidos in (
+            ('br', '.br', brotli.compress(datos, quality=11)),
+            ('gzip', '.gz', gzip.compress(datos, compresslevel=9, mtime=0)),
+        ):
+            if len(comprimidos) < len(datos):
+                alternativas[clave] = final + sufijo
+                escribir(final + sufijo, comprimidos)
+
+    manifiesto['archivos'][relativa] = final
+    manifiesto['alternativas'][final] = alternativas
+    return os.path.getsize(ruta), len(datos), {clave: os.path.getsize(os.path.join(app.static_folder, r))
+                                               for clave, r in alternativas.items()}
+
+def archivos_estaticos():
+    """Rutas relativas (con '/') de los archivos de static/ que entran en el build"""
+    for carpeta, subcarpetas, archivos in os.walk(app.static_folder):
+        if carpeta == app.static_folder:
+            subcarpetas[:] = [s for s in subcarpetas if s not in OMITIR]
+        for archivo in sorted(archivos):
+            yield os.path.relpath(os.path.join(carpeta, archivo), app.static_folder).replace(os.sep, '/')
+
+def main():
+    parser = argparse.ArgumentParser(description='Build de los archivos estáticos')
+    parser.add_argument('--lado', type=int, default=LADO_IMAGEN, help='lado máximo de las imágenes (px)')
+    parser.add_argument('--limpiar', action='store_true', help='borrar los builds anteriores')
+    args = parser.parse_args()
+
+    if args.limpiar:
+        shutil.rmtree(os.path.join(app.static_folder, DESTINO), ignore_errors=True)
+
+    print("=" * 70)
+    print("📦 BUILD DE ARCHIVOS ESTÁTICOS")
+    print("=" * 70)
+    print(f"   {'archivo':44} {'original':>9} {'build':>9} {'br/webp':>9}")
+
+    manifiesto = {'archivos': {}, 'alternativas': {}}
+    for relativa in archivos_estaticos():
+        original, build, alternativas = procesar(relativa, args.lado, manifiesto)
+        menor = min(alternativas.values(), default=build)
+        print(f"   {relativa[:44]:44} {original / 1024:8.1f}K {build / 1024:8.1f}K {menor / 1024:8.1f}K")
+
+    escribir(os.path.relpath(app.config['ESTATICOS_MANIFIESTO'], app.static_folder),
+             json.dumps(manifiesto, indent=1, ensure_ascii=False).encode('utf-8'))
+    print("=" * 70)
+    print(f"✅ {len(manifiesto['archivos'])} archivos en static/{DESTINO}/")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+# tests/test_archivos.py
+# Ciclo completo de un archivo subido: subida → borrado del reporte → purga.
+# Usa la base de datos de DATABASE_URL (migrada y con el admin por defecto);
+# si no está disponible, las pruebas se omiten.
+#
+# Uso:
+#   python -m pytest -q tests
+import io
+import os
+import uuid
+
+import psycopg2
+import pytest
+
+import app as aplicacion
+from app import ADMIN_EMAIL, DATABASE_URL, app
+
+@pytest.fixture
+def conn():
+    try:
+        conexion = psycopg2.connect(DATABASE_URL, connect_timeout=3)
+    except psycopg2.OperationalError:
+        pytest.skip('base de datos no disponible')
+    yield conexion
+    conexion.close()
+
+@pytest.fixture
+def cliente(monkeypatch):
+    # UPLOAD_FOLDER es relativa a la raíz del proyecto
+    monkeypatch.chdir(app.root_path)
+    monkeypatch.setitem(app.config, 'LIMITES_ACTIVOS', False)
+    cliente = app.test_client()
+    respuesta = cliente.post('/login', data={'usuario': ADMIN_EMAIL, 'password': 'admin123'})
+    assert respuesta.status_code == 302
+    return cliente
+
+def reportar(cliente, titulo, contenido):
+    respuesta = cliente.post('/reportar', data={
+        'titulo': titulo,
+        'descripcion': 'Prueba del ciclo de archivos',
+        'categoria': 'pruebas',
+        'ubicacion': 'Calle de prueba',
+        'imagen': (io.BytesIO(contenido), 'adjunto.pdf'),
+    }, content_type='multipart/form-data')
+    assert respuesta.status_code == 302
+
+def consultar(conn, sql, parametros):
+    with conn.cursor() as cur:
+        cur.execute(sql, parametros)
+        filas = cur.fetchall()
+    conn.commit()
+    return filas
+
+def purgar():
+    resultado = app.test_cli_runner().invoke(args=['purgar-archivos'])
+    assert resultado.exit_code == 0, resultado.output
+
+def test_subida_borrado_purga(cliente, conn):
+    titulo = f"prueba-archivos-{uuid.uuid4().hex}"
+    contenido = b'%PDF-1.4\n' + os.urandom(4096)
+
+    # Dos reportes con el mismo archivo: se guarda una vez, con dos referencias
+    reportar(cliente, titulo, contenido)
+    reportar(cliente, titulo, contenido)
+    reportes = consultar(conn, 'SELECT id, imagen FROM reportes WHERE titulo = %s ORDER BY id', (titulo,))
+    assert len(reportes) == 2 and reportes[0][1] == reportes[1][1]
+    ruta = reportes[0][1]
+    archivo = os.path.join(app.config['UPLOAD_FOLDER'], ruta)
+    assert os.path.exists(archivo)
+    assert consultar(conn, 'SELECT referencias FROM archivos WHERE ruta = %s', (ruta,)) == [(2,)]
+
+    # Borrar uno: el archivo sigue en uso y la purga no lo toca
+    assert cliente.post(f"/admin/reportes/{reportes[0][0]}/eliminar").status_code == 302
+    assert consultar(conn, 'SELECT referencias FROM archivos WHERE ruta = %s', (ruta,)) == [(1,)]
+    purgar()
+    assert os.path.exists(archivo)
+
+    # Borrar el otro: queda sin referencias y la purga lo elimina
+    assert cliente.post(f"/admin/reportes/{reportes[1][0]}/eliminar").status_code == 302
+    assert consultar(conn, 'SELECT referencias FROM archivos WHERE ruta = %s', (ruta,)) == [(0,)]
+    purgar()
+    assert not os.path.exists(archivo)
+    assert consultar(conn, 'SELECT 1 FROM archivos WHERE ruta = %s', (ruta,)) == []
+    assert consultar(conn, 'SELECT 1 FROM reportes WHERE titulo = %s', (titulo,)) == []
+
+def test_extension_segun_contenido():
+    jpeg = b'\xff\xd8\xff\xe0\x00\x10JFIF'
+    assert aplicacion.extension_subida(jpeg, 'foto.jpeg') == 'jpg'
+    assert aplicacion.extension_subida(jpeg, 'foto.JPG') == 'jpg'
+    assert aplicacion.extension_subida(b'%PDF-1.7', 'foto.jpg') == 'pdf'
+    assert aplicacion.extension_subida(b'sin firma', 'nota.JPEG') == 'jpg'
+
+def test_subida_sin_commit_no_deja_archivo(cliente, conn, monkeypatch):
+    titulo = f"prueba-archivos-{uuid.uuid4().hex}"
+    contenido = b'\x89PNG\r\n\x1a\n' + os.urandom(4096)
+    ruta = aplicacion.ruta_contenido(aplicacion.hashlib.sha256(contenido).hexdigest(), 'png')
+
+    # Falla después de colocar el archivo y antes del commit
+    def fallar(*args, **kwargs):
+        raise RuntimeError('fallo simulado')
+    monkeypatch.setattr(aplicacion, 'encolar_trabajo', fallar)
+    respuesta = cliente.post('/reportar', data={
+        'titulo': titulo,
+        'descripcion': 'Prueba del ciclo de archivos',
+        'categoria': 'pruebas',
+        'ubicacion': 'Calle de prueba',
+        'imagen': (io.BytesIO(contenido), 'foto.png'),
+    }, content_type='multipart/form-data')
+    assert respuesta.status_code != 302
+
+    assert consultar(conn, 'SELECT 1 FROM reportes WHERE titulo = %s', (titulo,)) == []
+    assert consultar(conn, 'SELECT 1 FROM archivos WHERE ruta = %s', (ruta,)) == []
+    assert not os.path.exists(os.path.join(app.config['UPLOAD_FOLDER'], ruta))
+    assert os.listdir(app.config['SUBIDAS_TEMPORALES']) == []
@@ -0,0 +1,16 @@
+# tests/test_estaticos.py
+# Minificado de JS de construir_estaticos.py.
+#
+# Uso:
+#   python -m pytest -q tests
+from construir_estaticos import minificar_js
+
+def test_conserva_el_codigo_tras_un_comentario_inicial():
+    assert minificar_js('/* x */ init();\nfoo();\n') == 'init();\nfoo();\n'
+    assert minificar_js('/* a */ /* b */ x();\n') == 'x();\n'
+
+def test_comentario_de_varias_lineas():
+    assert minificar_js('  /* a\n   b */ bar();\n/* solo */\nbaz();\n') == 'bar();\nbaz();\n'
+
+def test_no_toca_comentarios_dentro_de_plantillas():
+    assert minificar_js('z = `a\n/* no */\nb`;\n') == 'z = `a\n/* no */\nb`;\n'
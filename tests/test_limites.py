@@ -0,0 +1,97 @@
+# tests/test_limites.py
+# Límite de intentos (cubetas de fichas en SQLite) sobre un LIMITES_DB
+# temporal, con el reloj controlado por la prueba. No necesita PostgreSQL.
+#
+# Uso:
+#   python -m pytest -q tests
+import os
+import stat
+import threading
+
+import pytest
+
+import app as aplicacion
+from app import app
+
+EMAIL = 'vecino@example.com'
+IP = '203.0.113.7'
+
+class Reloj:
+    def __init__(self):
+        self.ahora = 1_000_000.0
+
+    def __call__(self):
+        return self.ahora
+
+@pytest.fixture
+def reloj(monkeypatch, tmp_path):
+    monkeypatch.setitem(app.config, 'LIMITES_ACTIVOS', True)
+    monkeypatch.setitem(app.config, 'LIMITES_DB', str(tmp_path / 'limites' / 'limites.sqlite3'))
+    # Conexiones nuevas para este LIMITES_DB, y sin limpiezas al azar
+    monkeypatch.setattr(aplicacion, '_limites_local', threading.local())
+    monkeypatch.setattr(aplicacion.random, 'random', lambda: 1.0)
+    reloj = Reloj()
+    monkeypatch.setattr(aplicacion.time, 'time', reloj)
+    return reloj
+
+def fichas(nombre, valor):
+    fila = aplicacion.get_limites_db().execute(
+        'SELECT fichas FROM limites WHERE clave = ?', (aplicacion.clave_limite(nombre, valor),)
+    ).fetchone()
+    return fila[0] if fila else None
+
+def test_carpeta_privada_al_conectar(reloj):
+    carpeta = os.path.dirname(app.config['LIMITES_DB'])
+    assert not os.path.exists(carpeta)
+    aplicacion.consumir_intento(('login_email', EMAIL))
+    assert stat.S_IMODE(os.stat(carpeta).st_mode) == 0o700
+
+def test_rechaza_al_agotar_la_cubeta(reloj):
+    capacidad, ritmo = aplicacion.cubeta_limite('login_email')
+    for _ in range(capacidad):
+        assert aplicacion.consumir_intento(('login_email', EMAIL)) == 0
+    espera = aplicacion.consumir_intento(('login_email', EMAIL))
+    assert espera == pytest.approx(1 / ritmo)
+    # Otro email tiene su propia cubeta
+    assert aplicacion.consumir_intento(('login_email', 'otro@example.com')) == 0
+
+def test_rellena_con_el_tiempo(reloj):
+    capacidad, ritmo = aplicacion.cubeta_limite('login_email')
+    for _ in range(capacidad):
+        aplicacion.consumir_intento(('login_email', EMAIL))
+    reloj.ahora += 1 / ritmo - 1
+    assert aplicacion.consumir_intento(('login_email', EMAIL)) > 0
+    reloj.ahora += 1
+    assert aplicacion.consumir_intento(('login_email', EMAIL)) == 0
+    assert aplicacion.consumir_intento(('login_email', EMAIL)) > 0
+
+def test_rechazo_no_gasta_fichas(reloj):
+    capacidad, ritmo = aplicacion.cubeta_limite('login_email')
+    for _ in range(capacidad):
+        aplicacion.consumir_intento(('login_ip', IP), ('login_email', EMAIL))
+    ip_antes = fichas('login_ip', IP)
+    for _ in range(10):
+        assert aplicacion.consumir_intento(('login_ip', IP), ('login_email', EMAIL)) > 0
+    # Ni la cubeta vacía ni la de la IP (que aún tenía fichas) se tocan
+    assert fichas('login_ip', IP) == ip_antes
+    reloj.ahora += 1 / ritmo
+    assert aplicacion.consumir_intento(('login_ip', IP), ('login_email', EMAIL)) == 0
+
+def test_nunca_supera_el_limite_en_una_ventana(reloj):
+    limite, periodo = aplicacion.LIMITES['login_email']
+    inicio = reloj.ahora
+    permitidos = []
+    for segundo in range(3 * periodo):
+        reloj.ahora = inicio + segundo
+        if aplicacion.consumir_intento(('login_email', EMAIL)) == 0:
+            permitidos.append(segundo)
+    assert max(sum(1 for p in permitidos if s <= p < s + periodo)
+               for s in range(3 * periodo)) <= limite
+
+def test_reiniciar_solo_vacia_la_cubeta_del_email(reloj):
+    aplicacion.consumir_intento(('login_ip', IP), ('login_email', EMAIL))
+    aplicacion.consumir_intento(('login_ip', IP), ('login_email', EMAIL))
+    ip_antes = fichas('login_ip', IP)
+    aplicacion.reiniciar_intentos('login_email', EMAIL)
+    assert fichas('login_email', EMAIL) is None
+    assert fichas('login_ip', IP) == ip_antes
@@ -0,0 +1,80 @@
+# tests/test_paginacion.py
+# Paginación por cursor (fecha, id) de paginar(): con muchas filas de la
+# misma fecha, recorrer las páginas hacia delante y hacia atrás no debe
+# saltarse ni repetir ninguna fila, con y sin filtros. Usa una tabla
+# temporal en la base de datos de DATABASE_URL; sin ella se omite.
+#
+# Uso:
+#   python -m pytest -q tests
+from datetime import datetime, timedelta
+from urllib.parse import urlencode
+
+import psycopg2
+import pytest
+
+from app import DATABASE_URL, app, paginar
+
+POR_PAGINA = 4
+
+@pytest.fixture
+def cur():
+    try:
+        conn = psycopg2.connect(DATABASE_URL, connect_timeout=3)
+    except psycopg2.OperationalError:
+        pytest.skip('base de datos no disponible')
+    cur = conn.cursor()
+    cur.execute('''CREATE TEMP TABLE paginas_prueba (
+                       id SERIAL PRIMARY KEY,
+                       fecha TIMESTAMP NOT NULL,
+                       estado TEXT NOT NULL
+                   )''')
+    # Grupos de hasta 7 filas con la misma fecha (más que una página), con
+    # microsegundos, y estados alternos para filtrar
+    base = datetime(2024, 5, 1, 12, 0, 0, 123456)
+    for i in range(30):
+        cur.execute('INSERT INTO paginas_prueba (fecha, estado) VALUES (%s, %s)',
+                    (base + timedelta(minutes=i // 7), 'pendiente' if i % 3 else 'resuelto'))
+    yield cur
+    conn.close()
+
+def pagina(cur, filtro, **args):
+    query, params = 'SELECT id, fecha FROM paginas_prueba WHERE 1=1', []
+    if filtro:
+        query += ' AND estado = %s'
+        params.append(filtro)
+    with app.test_request_context('/?' + urlencode({'por_pagina': POR_PAGINA, **args})):
+        filas, paginacion = paginar(cur, query, params, 'fecha', 'id')
+    return [fila['id'] for fila in filas], paginacion
+
+def esperado(cur, filtro):
+    cur.execute('SELECT id FROM paginas_prueba WHERE %s IS NULL OR estado = %s ORDER BY fecha DESC, id DESC',
+                (filtro, filtro))
+    return [fila[0] for fila in cur.fetchall()]
+
+@pytest.mark.parametrize('filtro', [None, 'pendiente', 'resuelto'])
+def test_recorrido_hacia_delante_y_hacia_atras(cur, filtro):
+    orden = esperado(cur, filtro)
+
+    # Hacia delante, siguiendo 'siguiente' desde la primera página
+    paginas = []
+    ids, paginacion = pagina(cur, filtro)
+    assert paginacion['anterior'] is None
+    paginas.append(ids)
+    while paginacion['siguiente']:
+        ids, paginacion = pagina(cur, filtro, despues=paginacion['siguiente'])
+        paginas.append(ids)
+    assert [id for ids in paginas for id in ids] == orden
+    assert all(len(ids) == POR_PAGINA for ids in paginas[:-1])
+
+    # Hacia atrás desde la última, siguiendo 'anterior': las mismas páginas
+    atras = [paginas[-1]]
+    while paginacion['anterior']:
+        ids, paginacion = pagina(cur, filtro, antes=paginacion['anterior'])
+        atras.append(ids)
+        # Desde una página alcanzada hacia atrás se puede volver a avanzar
+        assert paginacion['siguiente']
+        assert pagina(cur, filtro, despues=paginacion['siguiente'])[0] == atras[-2]
+    assert atras[::-1] == paginas
+
+def test_cursor_invalido_es_la_primera_pagina(cur):
+    assert pagina(cur, None, despues='no-es-un-cursor') == pagina(cur, None)